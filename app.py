@@ -5,8 +5,6 @@ Upload PDF statements and view parsed results
 
 import streamlit as st
 import json
-from pathlib import Path
-import tempfile
 from main import parse_statement
 
 # Page configuration
@@ -16,8 +14,30 @@ st.set_page_config(
     layout="wide"
 )
 
-# Custom CSS
-st.markdown("""
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _cached_parse(pdf_bytes: bytes, use_ocr: bool) -> dict:
+    """
+    Parse an uploaded statement, memoised on the file contents
+    
+    Streamlit hashes the bytes argument, so re-running the script (or
+    re-parsing the same upload) returns the cached result instantly.
+    """
+    # Parse straight from memory; the upload never touches the disk
+    return parse_statement(pdf_bytes, use_ocr=use_ocr)
+
+
+@st.cache_resource
+def _static_chrome_html() -> str:
+    """
+    Build the page CSS and header markup once per server process
+    
+    Streamlit re-executes this script on every interaction; caching the
+    markup means reruns emit one prebuilt element instead of rebuilding
+    and sending three.
+    """
+    # Custom CSS
+    css = """
     <style>
     .main-header {
         font-size: 2.5rem;
@@ -52,12 +72,39 @@ st.markdown("""
         border-radius: 5px;
         margin-bottom: 1rem;
     }
+    .bank-row {
+        display: flex;
+        gap: 1rem;
+        margin-bottom: 1rem;
+    }
+    .bank-chip {
+        flex: 1;
+        background-color: rgba(28, 131, 225, 0.1);
+        color: #004280;
+        padding: 1rem;
+        border-radius: 0.5rem;
+    }
     </style>
-""", unsafe_allow_html=True)
+"""
 
-# Header
-st.markdown('<div class="main-header">💳 Credit Card Statement Parser</div>', unsafe_allow_html=True)
-st.markdown('<div class="sub-header">Extract key information from your credit card statements</div>', unsafe_allow_html=True)
+    # Header
+    header = (
+        '<div class="main-header">💳 Credit Card Statement Parser</div>'
+        '<div class="sub-header">Extract key information from your credit card statements</div>'
+    )
+    
+    return css + header
+
+
+@st.cache_resource
+def _banks_row_html() -> str:
+    """Build the supported-banks row as a single flexbox element"""
+    banks = ["HDFC Bank", "ICICI Bank", "SBI Card", "Axis Bank", "American Express"]
+    chips = "".join(f'<div class="bank-chip">{bank}</div>' for bank in banks)
+    return f'<div class="bank-row">{chips}</div>'
+
+
+st.markdown(_static_chrome_html(), unsafe_allow_html=True)
 
 # File upload section
 st.markdown("### 📄 Upload Your Statement")
@@ -79,14 +126,9 @@ if uploaded_file is not None:
     
     if st.button("🔍 Parse Statement", type="primary"):
         with st.spinner("Processing your statement..."):
-            # Save uploaded file to temporary location
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-                tmp_file.write(uploaded_file.getvalue())
-                tmp_path = tmp_file.name
-            
             try:
                 # Parse the statement
-                result = parse_statement(tmp_path, use_ocr=use_ocr)
+                result = _cached_parse(uploaded_file.getvalue(), use_ocr)
                 
                 # Display results
                 st.markdown("---")
@@ -134,21 +176,14 @@ if uploaded_file is not None:
                         file_name=f"parsed_statement_{uploaded_file.name.replace('.pdf', '')}.json",
                         mime="application/json"
                     )
-                
+            
             except Exception as e:
                 st.error(f"An unexpected error occurred: {str(e)}")
-            
-            finally:
-                # Clean up temporary file
-                Path(tmp_path).unlink(missing_ok=True)
 
 
 # Supported banks info
 st.markdown("### 🏦 Supported Banks")
-cols = st.columns(5)
-banks = ["HDFC Bank", "ICICI Bank", "SBI Card", "Axis Bank", "American Express"]
-for col, bank in zip(cols, banks):
-    col.info(bank)
+st.markdown(_banks_row_html(), unsafe_allow_html=True)
 
 #st.markdown("---")
 
@@ -170,7 +205,7 @@ with st.expander("🔒 Privacy & Security"):
     st.markdown("""
     - All processing is done locally on your machine
     - No data is sent to external servers
-    - Uploaded files are temporarily stored and deleted after processing
+    - Uploaded files are processed in memory and never written to disk
     - Your financial information remains private and secure
     """)
 
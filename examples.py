@@ -4,10 +4,39 @@ Demonstrates various ways to use the parser
 """
 
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+import pandas as pd
 from main import parse_statement, extract_text_from_pdf, detect_bank
 
 
+STATEMENT_COLUMNS = [
+    "issuer", "card_holder", "last_4_digits", "billing_cycle",
+    "payment_due_date", "total_amount_due", "error", "message"
+]
+
+
+def _parse_to_frame(pdf_files) -> pd.DataFrame:
+    """
+    Parse PDFs in parallel into one columnar table (one row per file)
+    
+    Adds a "filename" column and a numeric "amount" column derived from
+    total_amount_due, so reports can aggregate with vectorised ops.
+    """
+    # Statements are independent, so parse them across all CPU cores
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        records = list(executor.map(parse_statement, [str(p) for p in pdf_files], chunksize=4))
+    
+    df = pd.DataFrame.from_records(records).reindex(columns=STATEMENT_COLUMNS)
+    df.insert(0, "filename", [p.name for p in pdf_files])
+    df["amount"] = pd.to_numeric(
+        df["total_amount_due"].astype("string").str.replace(r"[₹,\s]", "", regex=True),
+        errors="coerce"
+    )
+    return df
+
+
 def example_1_basic_parsing():
     """Example 1: Basic PDF parsing"""
     print("\n" + "="*60)
@@ -60,20 +89,17 @@ def example_3_batch_processing():
         print("❌ No PDF files found in sample_pdfs/")
         return
     
-    results = []
-    
-    for pdf_file in pdf_files:
-        print(f"\nProcessing: {pdf_file.name}")
-        result = parse_statement(str(pdf_file))
-        results.append({
-            "filename": pdf_file.name,
-            "data": result
-        })
+    results = _parse_to_frame(pdf_files)
+    for filename in results["filename"]:
+        print(f"\nProcessed: {filename}")
     
     # Save all results to JSON
     output_file = "batch_results.json"
+    records = results.drop(columns="amount")
+    # Cells missing from a file's result are NaN in the frame; write them as null
+    records = records.astype(object).where(records.notna(), None).to_dict("records")
     with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+        json.dump(records, f, indent=2, ensure_ascii=False)
     
     print(f"\n✅ Processed {len(results)} files")
     print(f"Results saved to: {output_file}")
@@ -105,7 +131,7 @@ def example_4_custom_extraction():
         
         # Step 3: Parse with detected parser
         print("\nStep 3: Parsing statement...")
-        result = bank_config['parser'](text)
+        result = bank_config['parser'](text).to_dict()
         
         # Step 4: Display results
         print("\nStep 4: Results")
@@ -163,24 +189,27 @@ def example_6_export_to_csv():
         print("❌ No PDF files found")
         return
     
-    # Parse all statements
-    results = []
-    for pdf_file in pdf_files:
-        result = parse_statement(str(pdf_file))
-        if "error" not in result:
-            results.append(result)
-    
-    # Export to CSV
-    if results:
-        csv_file = "statements_export.csv"
-        
-        with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=results[0].keys())
-            writer.writeheader()
-            writer.writerows(results)
-        
-        print(f"✅ Exported {len(results)} statements to {csv_file}")
+    # Parse statements in parallel and stream rows straight into the CSV
+    csv_file = "statements_export.csv"
+    exported = 0
+    
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor, \
+            open(csv_file, 'w', newline='', encoding='utf-8') as f:
+        writer = None
+        parsed = executor.map(parse_statement, [str(p) for p in pdf_files], chunksize=4)
+        for result in parsed:
+            if "error" in result:
+                continue
+            if writer is None:
+                writer = csv.DictWriter(f, fieldnames=result.keys())
+                writer.writeheader()
+            writer.writerow(result)
+            exported += 1
+    
+    if exported:
+        print(f"✅ Exported {exported} statements to {csv_file}")
     else:
+        Path(csv_file).unlink(missing_ok=True)
         print("❌ No valid results to export")
 
 
@@ -198,27 +227,14 @@ def example_7_filter_by_bank():
         print("❌ No PDF files found")
         return
     
-    hdfc_statements = []
-    
-    for pdf_file in pdf_files:
-        result = parse_statement(str(pdf_file))
-        
-        if result.get("issuer") == target_bank:
-            hdfc_statements.append({
-                "file": pdf_file.name,
-                "data": result
-            })
+    results = _parse_to_frame(pdf_files)
+    hdfc_statements = results[results["issuer"] == target_bank]
     
     print(f"Found {len(hdfc_statements)} {target_bank} statements")
     
     # Calculate total amount due across all HDFC statements
-    if hdfc_statements:
-        total = 0
-        for stmt in hdfc_statements:
-            amount_str = stmt["data"].get("total_amount_due", "₹0")
-            # Extract numeric value
-            amount = float(amount_str.replace("₹", "").replace(",", ""))
-            total += amount
+    if not hdfc_statements.empty:
+        total = hdfc_statements["amount"].sum()
         
         print(f"Total amount due across all {target_bank} statements: ₹{total:,.2f}")
 
@@ -237,13 +253,10 @@ def example_8_summary_report():
         return
     
     # Parse all statements
-    results = []
-    for pdf_file in pdf_files:
-        result = parse_statement(str(pdf_file))
-        if "error" not in result:
-            results.append(result)
+    results = _parse_to_frame(pdf_files)
+    results = results[results["error"].isna()]
     
-    if not results:
+    if results.empty:
         print("❌ No valid statements found")
         return
     
@@ -253,24 +266,14 @@ def example_8_summary_report():
     print(f"Total Statements Processed: {len(results)}")
     
     # Group by bank
-    by_bank = {}
-    for result in results:
-        bank = result.get("issuer", "Unknown")
-        by_bank[bank] = by_bank.get(bank, 0) + 1
+    by_bank = results.groupby(results["issuer"].fillna("Unknown"), sort=False)["amount"].agg(count="size", total="sum")
     
     print("\nStatements by Bank:")
-    for bank, count in by_bank.items():
+    for bank, count in by_bank["count"].items():
         print(f"  {bank:20s}: {count}")
     
     # Calculate total due
-    total_due = 0
-    for result in results:
-        amount_str = result.get("total_amount_due", "₹0")
-        try:
-            amount = float(amount_str.replace("₹", "").replace(",", ""))
-            total_due += amount
-        except:
-            pass
+    total_due = by_bank["total"].sum()
     
     print(f"\nTotal Amount Due (All Cards): ₹{total_due:,.2f}")
 
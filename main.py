@@ -3,106 +3,502 @@ Credit Card Statement Parser - Main Module
 Automatically detects bank and extracts key information from credit card statements
 """
 
+import io
+import os
+import mmap
 import sys
 import json
-import pdfplumber
+import atexit
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import closing, contextmanager
+from enum import Enum
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Optional
+from typing import BinaryIO, Dict, Iterator, Optional, Tuple, Union
 
-# Import all parsers
-from parsers import (
-    parse_hdfc_statement, validate_hdfc_statement,
-    parse_icici_statement, validate_icici_statement,
-    parse_sbi_statement, validate_sbi_statement,
-    parse_axis_statement, validate_axis_statement,
-    parse_amex_statement, validate_amex_statement
-)
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# A statement can be given as a file path, its raw bytes or a binary stream
+PDFSource = Union[str, Path, bytes, bytearray, BinaryIO]
+
+# Parser modules are imported on first use (see parsers.__getattr__)
+import parsers
+
+
+def _lazy(name: str):
+    """
+    Wrap a parsers function so its module is only imported when first called
+    
+    Args:
+        name: Function name exported by the parsers package
+    
+    Returns:
+        Callable taking the statement text
+    """
+    def call(text):
+        return getattr(parsers, name)(text)
+    
+    return call
 
 
 # Bank detection and parsing configuration
 BANK_CONFIGS = [
     {
         "name": "HDFC Bank",
-        "validator": validate_hdfc_statement,
-        "parser": parse_hdfc_statement
+        "issuer": "hdfc",
+        "validator": _lazy("validate_hdfc_statement"),
+        "keywords": "HDFC_KEYWORDS",
+        "parser": _lazy("parse_hdfc_statement")
     },
     {
         "name": "ICICI Bank",
-        "validator": validate_icici_statement,
-        "parser": parse_icici_statement
+        "issuer": "icici",
+        "validator": _lazy("validate_icici_statement"),
+        "keywords": "ICICI_KEYWORDS",
+        "parser": _lazy("parse_icici_statement")
     },
     {
         "name": "SBI Card",
-        "validator": validate_sbi_statement,
-        "parser": parse_sbi_statement
+        "issuer": "sbi",
+        "validator": _lazy("validate_sbi_statement"),
+        "keywords": "SBI_KEYWORDS",
+        "parser": _lazy("parse_sbi_statement")
     },
     {
         "name": "Axis Bank",
-        "validator": validate_axis_statement,
-        "parser": parse_axis_statement
+        "issuer": "axis",
+        "validator": _lazy("validate_axis_statement"),
+        "keywords": "AXIS_KEYWORDS",
+        "parser": _lazy("parse_axis_statement")
     },
     {
         "name": "American Express",
-        "validator": validate_amex_statement,
-        "parser": parse_amex_statement
+        "issuer": "amex",
+        "validator": _lazy("validate_amex_statement"),
+        "keywords": "AMEX_KEYWORDS",
+        "parser": _lazy("parse_amex_statement")
     }
 ]
 
 
-def extract_text_from_pdf(pdf_path: str) -> str:
+# Number of leading characters detect_bank checks before the full text
+DETECTION_HEADER_CHARS = 4096
+
+# parse_statement tries to stop after each of this many leading pages before
+# reading the rest of the document in one go
+EARLY_EXIT_PAGES = 2
+
+
+# pdfplumber documents with at least this many pages are extracted in parallel
+PARALLEL_PAGE_THRESHOLD = 4
+
+# Pages probed, and characters required on one of them, to treat a PDF as
+# having a text layer
+TEXT_LAYER_PROBE_PAGES = 2
+TEXT_LAYER_MIN_CHARS = 10
+
+
+class PDFBackend(str, Enum):
+    """Text extraction engines supported by extract_text_from_pdf"""
+    PYPDFIUM2 = "pypdfium2"
+    PDFPLUMBER = "pdfplumber"
+
+
+def _resolve_backend(backend: Union[PDFBackend, str, None]) -> PDFBackend:
+    """Pick the extraction backend, falling back to pdfplumber if pypdfium2 is missing"""
+    if backend is None:
+        backend = PDFBackend.PYPDFIUM2 if pdfium is not None else PDFBackend.PDFPLUMBER
+    backend = PDFBackend(backend)
+    
+    if backend is PDFBackend.PYPDFIUM2 and pdfium is None:
+        print("Warning: pypdfium2 not installed. Falling back to pdfplumber.")
+        backend = PDFBackend.PDFPLUMBER
+    
+    return backend
+
+
+def _is_path(source: PDFSource) -> bool:
+    """Check whether a PDF source refers to a file on disk"""
+    return isinstance(source, (str, Path))
+
+
+@contextmanager
+def _open_stream(source: PDFSource) -> Iterator[BinaryIO]:
+    """
+    Open a PDF source as a seekable binary stream
+    
+    Files on disk are memory-mapped read-only, so pdfminer's many small
+    seek/read calls are served straight from the page cache instead of
+    going through buffered file I/O. Raw bytes are wrapped in a stream and
+    file objects pass through.
+    """
+    if not _is_path(source):
+        yield io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+        return
+    
+    with open(source, "rb") as f:
+        # mmap cannot map an empty file; let pdfplumber report it as invalid
+        if os.fstat(f.fileno()).st_size == 0:
+            yield f
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def _iter_pages_pypdfium2(pdf_path: PDFSource) -> Iterator[str]:
+    """Yield page text using PDFium"""
+    # PdfDocument reads paths, bytes and file objects directly
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        for page in pdf:
+            textpage = page.get_textpage()
+            # PDFium separates lines with CRLF; the parsers expect plain LF
+            page_text = textpage.get_text_bounded().replace("\r\n", "\n")
+            textpage.close()
+            page.close()
+            if page_text:
+                yield page_text
+    finally:
+        # Close explicitly so the underlying file mapping is released
+        pdf.close()
+
+
+def _iter_pages_pdfplumber(pdf_path: PDFSource) -> Iterator[str]:
+    """Yield page text using pdfplumber (preserves table layout)"""
+    import pdfplumber
+    
+    with _open_stream(pdf_path) as stream, pdfplumber.open(stream) as pdf:
+        for page in pdf.pages:
+            page_text = page.extract_text()
+            if page_text:
+                yield page_text
+
+
+def _extract_page_range(job: Tuple[str, int, int]) -> str:
+    """Extract a contiguous range of pages with pdfplumber (runs inside a worker process)"""
+    import pdfplumber
+    
+    pdf_path, start, stop = job
+    # pdfplumber numbers pages from 1 and only builds the requested ones
+    pages = range(start + 1, stop + 1)
+    with _open_stream(pdf_path) as stream, pdfplumber.open(stream, pages=pages) as pdf:
+        page_texts = (page.extract_text() for page in pdf.pages)
+        return "\n".join(page_text for page_text in page_texts if page_text)
+
+
+def _extract_text_pdfplumber_parallel(pdf_path: Union[str, Path]) -> Optional[str]:
+    """
+    Extract pages with pdfplumber across a process pool
+    
+    Each worker opens the document once and extracts one contiguous range
+    of pages, with one range per CPU.
+    
+    Returns:
+        Extracted text, or None if fewer than two CPUs are available or the
+        document is too short to be worth the pool start-up cost
+    """
+    n_workers = os.cpu_count() or 1
+    if n_workers < 2:
+        return None
+    
+    import pdfplumber
+    
+    with _open_stream(pdf_path) as stream, pdfplumber.open(stream) as pdf:
+        n_pages = len(pdf.pages)
+    
+    if n_pages < PARALLEL_PAGE_THRESHOLD:
+        return None
+    
+    n_workers = min(n_workers, n_pages)
+    bounds = [n_pages * i // n_workers for i in range(n_workers + 1)]
+    jobs = [(pdf_path, start, stop) for start, stop in zip(bounds, bounds[1:])]
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        range_texts = executor.map(_extract_page_range, jobs)
+        return "\n".join(range_text for range_text in range_texts if range_text)
+
+
+def iter_page_text(pdf_path: PDFSource, backend: Union[PDFBackend, str, None] = None) -> Iterator[str]:
     """
-    Extract text from PDF using pdfplumber
+    Lazily extract text from a PDF one page at a time
     
     Args:
-        pdf_path: Path to the PDF file
+        pdf_path: Path to the PDF file, its raw bytes or a binary stream
+        backend: Extraction engine to use (see extract_text_from_pdf)
+        
+    Returns:
+        Iterator over the non-empty text of each page, in order
+    """
+    if _resolve_backend(backend) is PDFBackend.PYPDFIUM2:
+        return _iter_pages_pypdfium2(pdf_path)
+    return _iter_pages_pdfplumber(pdf_path)
+
+
+def extract_text_from_pdf(pdf_path: PDFSource, backend: Union[PDFBackend, str, None] = None) -> str:
+    """
+    Extract text from PDF using pypdfium2 (falls back to pdfplumber)
+    
+    Args:
+        pdf_path: Path to the PDF file, its raw bytes or a binary stream
+        backend: Extraction engine to use. Defaults to pypdfium2 when it is
+            installed; pass "pdfplumber" for statements whose parsing depends
+            on table/cell layout (e.g. ICICI/HDFC summary boxes)
         
     Returns:
         Extracted text from all pages
     """
-    text = ""
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
+        backend = _resolve_backend(backend)
+        # Worker processes reopen the file, so only paths are parallelised
+        if backend is PDFBackend.PDFPLUMBER and _is_path(pdf_path):
+            text = _extract_text_pdfplumber_parallel(pdf_path)
+            if text is not None:
+                return text
+        return "\n".join(iter_page_text(pdf_path, backend))
     except Exception as e:
         print(f"Error extracting text from PDF: {e}")
         return ""
+
+
+# Render at pdf2image's default 200 DPI (PDF user space is 72 DPI)
+OCR_RENDER_SCALE = 200 / 72
+
+# Binarize and deskew pages before OCR so Tesseract can skip its own
+# (much slower) image preprocessing
+OCR_PREPROCESS = True
+OCR_MAX_SKEW_DEGREES = 5.0
+OCR_SKEW_STEP_DEGREES = 0.25
+
+# Pages are OCRed concurrently (tesserocr releases the GIL while recognising);
+# the threads persist across files so each keeps its Tesseract instance warm
+OCR_THREADS = min(4, os.cpu_count() or 1)
+
+# A Tesseract instance must not be shared between threads, so every OCR
+# thread lazily gets its own; all of them are ended at interpreter exit
+_OCR_LOCAL = threading.local()
+_OCR_APIS = []
+_OCR_EXECUTOR = None
+
+
+def _get_ocr_api():
+    """Lazily create the calling thread's persistent Tesseract instance"""
+    api = getattr(_OCR_LOCAL, "api", None)
+    if api is None:
+        import tesserocr
+        api = tesserocr.PyTessBaseAPI()
+        # Preprocessed pages are already dark-on-light
+        api.SetVariable("tessedit_do_invert", "0")
+        _OCR_LOCAL.api = api
+        _OCR_APIS.append(api)
+    return api
+
+
+def _get_ocr_executor() -> ThreadPoolExecutor:
+    """Lazily create the thread pool shared by all OCR calls"""
+    global _OCR_EXECUTOR
+    if _OCR_EXECUTOR is None:
+        _OCR_EXECUTOR = ThreadPoolExecutor(max_workers=OCR_THREADS, thread_name_prefix="ocr")
+    return _OCR_EXECUTOR
+
+
+@atexit.register
+def _shutdown_ocr():
+    """Stop the OCR threads and release their Tesseract instances"""
+    if _OCR_EXECUTOR is not None:
+        _OCR_EXECUTOR.shutdown(wait=True)
+    for api in _OCR_APIS:
+        api.End()
+    _OCR_APIS.clear()
+
+
+def _otsu_threshold(hist: "np.ndarray") -> int:
+    """Return the grey level that maximises between-class variance (Otsu)"""
+    import numpy as np
     
-    return text
+    hist = hist.astype(np.float64)
+    weight_bg = np.cumsum(hist)
+    weight_fg = weight_bg[-1] - weight_bg
+    cum_mean = np.cumsum(hist * np.arange(hist.size))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        between = (cum_mean[-1] * weight_bg / weight_bg[-1] - cum_mean) ** 2 / (weight_bg * weight_fg)
+    between[~np.isfinite(between)] = 0
+    return int(np.argmax(between))
 
 
-def extract_text_with_ocr(pdf_path: str) -> str:
+def _estimate_skew(ink: "np.ndarray") -> float:
     """
-    Fallback: Extract text using OCR (pytesseract) for image-based PDFs
+    Estimate page skew from the horizontal projection profile of ink pixels
     
     Args:
-        pdf_path: Path to the PDF file
+        ink: Boolean array, True where the page has ink
         
     Returns:
-        Extracted text using OCR
+        Angle in degrees (positive when lines slope down to the right)
     """
-    try:
-        import pytesseract
-        from pdf2image import convert_from_path
+    import numpy as np
+    
+    ys, xs = np.nonzero(ink)
+    if ys.size == 0:
+        return 0.0
+    
+    # Subsample dense pages; the profile shape is preserved
+    step = max(1, ys.size // 200_000)
+    ys = ys[::step].astype(np.float64)
+    xs = xs[::step].astype(np.float64)
+    
+    best_angle, best_score = 0.0, -1.0
+    angles = np.arange(-OCR_MAX_SKEW_DEGREES, OCR_MAX_SKEW_DEGREES + 1e-9, OCR_SKEW_STEP_DEGREES)
+    for angle in angles:
+        rows = np.rint(ys - xs * np.tan(np.radians(angle))).astype(np.int64)
+        profile = np.bincount(rows - rows.min())
+        # Text lines aligned with the rows give the sharpest (highest energy) profile
+        score = float(np.dot(profile, profile))
+        if score > best_score:
+            best_angle, best_score = float(angle), score
+    
+    return best_angle
+
+
+def _preprocess_for_ocr(image):
+    """
+    Binarize (Otsu) and deskew a page image with vectorised NumPy
+    
+    Args:
+        image: PIL image of a rendered page
         
-        text = ""
+    Returns:
+        Black-on-white PIL image ready for Tesseract
+    """
+    import numpy as np
+    from PIL import Image
+    
+    gray = np.asarray(image.convert("L"))
+    hist = np.bincount(gray.ravel(), minlength=256)
+    ink = gray <= _otsu_threshold(hist)
+    
+    binary = Image.fromarray(np.where(ink, 0, 255).astype(np.uint8))
+    angle = _estimate_skew(ink)
+    if angle:
+        binary = binary.rotate(angle, resample=Image.NEAREST, expand=True, fillcolor=255)
+    return binary
+
+
+def _prepare_ocr_image(image):
+    """Apply OCR preprocessing when enabled and NumPy is available"""
+    if not OCR_PREPROCESS:
+        return image
+    # NumPy is imported on the first OCRed page rather than with main
+    try:
+        return _preprocess_for_ocr(image)
+    except ImportError:
+        return image
+
+
+def _ocr_page(image) -> str:
+    """OCR one rendered page with the calling thread's Tesseract instance"""
+    api = _get_ocr_api()
+    api.SetImage(_prepare_ocr_image(image))
+    return api.GetUTF8Text()
+
+
+def _ocr_with_tesserocr(pdf_path: PDFSource) -> str:
+    """OCR pages rendered in-process by PDFium on persistent tesserocr workers"""
+    # Raise ImportError before rendering anything if tesserocr is missing
+    import tesserocr  # noqa: F401
+    
+    executor = _get_ocr_executor()
+    # PDFium is not thread-safe, so pages are rendered here and only the
+    # preprocessing and recognition run on the pool
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        futures = []
+        for page in pdf:
+            image = page.render(scale=OCR_RENDER_SCALE).to_pil()
+            page.close()
+            futures.append(executor.submit(_ocr_page, image))
+        return "\n".join(future.result() for future in futures)
+    finally:
+        pdf.close()
+
+
+def _ocr_with_pytesseract(pdf_path: PDFSource) -> str:
+    """OCR pages via pdf2image (poppler) and the tesseract CLI"""
+    import pytesseract
+    from pdf2image import convert_from_bytes, convert_from_path
+    
+    text = ""
+    if _is_path(pdf_path):
         images = convert_from_path(pdf_path)
+    elif isinstance(pdf_path, (bytes, bytearray)):
+        images = convert_from_bytes(bytes(pdf_path))
+    else:
+        pdf_path.seek(0)
+        images = convert_from_bytes(pdf_path.read())
+    
+    for i, image in enumerate(images):
+        page_text = pytesseract.image_to_string(_prepare_ocr_image(image))
+        text += page_text + "\n"
+    
+    return text
+
+
+def extract_text_with_ocr(pdf_path: PDFSource) -> str:
+    """
+    Fallback: Extract text using OCR for image-based PDFs
+    
+    Uses pypdfium2 + tesserocr (no subprocesses) when available, otherwise
+    pdf2image + pytesseract.
+    
+    Args:
+        pdf_path: Path to the PDF file, its raw bytes or a binary stream
         
-        for i, image in enumerate(images):
-            page_text = pytesseract.image_to_string(image)
-            text += page_text + "\n"
-        
-        return text
+    Returns:
+        Extracted text using OCR
+    """
+    try:
+        if pdfium is not None:
+            try:
+                return _ocr_with_tesserocr(pdf_path)
+            except ImportError:
+                pass
+        return _ocr_with_pytesseract(pdf_path)
     except ImportError:
-        print("Warning: pytesseract or pdf2image not installed. OCR fallback unavailable.")
+        print("Warning: tesserocr or pytesseract/pdf2image not installed. OCR fallback unavailable.")
         return ""
     except Exception as e:
         print(f"Error during OCR extraction: {e}")
         return ""
 
 
+def _bank_for_issuer(issuer: Optional[str]) -> Optional[Dict]:
+    """
+    Look up the bank configuration tagged with an issuer
+    
+    BANK_CONFIGS is searched at call time so banks appended after import
+    are found too.
+    
+    Args:
+        issuer: Tag returned by parsers.detect_issuer, or None
+        
+    Returns:
+        Bank configuration dict, or None if no bank carries the tag
+    """
+    if issuer is None:
+        return None
+    for bank_config in BANK_CONFIGS:
+        if bank_config.get("issuer") == issuer:
+            return bank_config
+    return None
+
+
 def detect_bank(text: str) -> Optional[Dict]:
     """
     Detect which bank issued the statement
@@ -113,39 +509,222 @@ def detect_bank(text: str) -> Optional[Dict]:
     Returns:
         Bank configuration dict or None if not detected
     """
-    for bank_config in BANK_CONFIGS:
-        if bank_config["validator"](text):
-            return bank_config
+    # Issuer names sit in the masthead, so try the first page header before
+    # scanning the whole statement
+    header = text[:DETECTION_HEADER_CHARS]
+    bank_config = _bank_for_issuer(parsers.detect_issuer(header))
+    if bank_config is None and len(text) > len(header):
+        bank_config = _bank_for_issuer(parsers.detect_issuer(text))
+    if bank_config is not None:
+        return bank_config
+    
+    # Fall back to the per-bank validators for layouts the fingerprints miss
+    return _first_valid_bank(text)
+
+
+def has_text_layer(pdf_path: PDFSource) -> bool:
+    """
+    Check whether a PDF has an extractable text layer
+    
+    Counts the characters PDFium finds on the first few pages, which takes
+    a few milliseconds even for scanned statements.
+    
+    Args:
+        pdf_path: Path to the PDF file, its raw bytes or a binary stream
+        
+    Returns:
+        False if the probed pages carry no text (scanned document), True
+        otherwise or if pypdfium2 is not installed
+    """
+    if pdfium is None:
+        return True
+    
+    try:
+        pdf = pdfium.PdfDocument(pdf_path)
+    except Exception:
+        # Let the regular extraction path report unreadable files
+        return True
+    
+    try:
+        for index in range(min(len(pdf), TEXT_LAYER_PROBE_PAGES)):
+            page = pdf[index]
+            textpage = page.get_textpage()
+            n_chars = textpage.count_chars()
+            textpage.close()
+            page.close()
+            if n_chars >= TEXT_LAYER_MIN_CHARS:
+                return True
+        return False
+    finally:
+        pdf.close()
+
+
+# (number of BANK_CONFIGS it was built from, automaton)
+_VALIDATOR_AUTOMATON = None
+
+
+def _validator_automaton():
+    """
+    Build an Aho-Corasick automaton over every bank's validator keywords
+    
+    Only banks whose config names a "keywords" tuple in parsers are included;
+    the automaton is rebuilt if banks were added to BANK_CONFIGS since.
+    
+    Returns:
+        Automaton whose values are BANK_CONFIGS indices
+    """
+    global _VALIDATOR_AUTOMATON
+    if _VALIDATOR_AUTOMATON is None or _VALIDATOR_AUTOMATON[0] != len(BANK_CONFIGS):
+        automaton = ahocorasick.Automaton()
+        for index, bank_config in enumerate(BANK_CONFIGS):
+            if "keywords" not in bank_config:
+                continue
+            for keyword in getattr(parsers, bank_config["keywords"]):
+                # A keyword shared by two banks belongs to the earlier one
+                if keyword not in automaton:
+                    automaton.add_word(keyword, index)
+        automaton.make_automaton()
+        _VALIDATOR_AUTOMATON = (len(BANK_CONFIGS), automaton)
+    return _VALIDATOR_AUTOMATON[1]
+
+
+def _first_valid_bank(text: str) -> Optional[Dict]:
+    """
+    Return the first bank (in BANK_CONFIGS order) whose validator accepts text
+    
+    With pyahocorasick installed all keyword-based validators are answered
+    by one pass over the lowercased text instead of one lowercase copy and
+    several substring scans per bank; banks without a "keywords" entry are
+    asked through their validator.
+    """
+    if ahocorasick is None:
+        for bank_config in BANK_CONFIGS:
+            if bank_config["validator"](text):
+                return bank_config
+        return None
     
+    automaton = _validator_automaton()
+    # The automaton needs at least one keyword before it can be searched
+    hits = {index for _, index in automaton.iter(text.lower())} if len(automaton) else set()
+    for index, bank_config in enumerate(BANK_CONFIGS):
+        if index in hits:
+            return bank_config
+        if "keywords" not in bank_config and bank_config["validator"](text):
+            return bank_config
     return None
 
 
-def parse_statement(pdf_path: str, use_ocr: bool = False) -> Dict:
+def _read_pages(pages: Iterator[str], limit: Optional[int] = None) -> Optional[list]:
+    """
+    Pull the next pages from a page iterator
+    
+    Args:
+        pages: Iterator returned by iter_page_text
+        limit: Maximum number of pages to read, or None for all remaining
+        
+    Returns:
+        List of page texts, or None if extraction failed
+    """
+    try:
+        return list(islice(pages, limit))
+    except Exception as e:
+        print(f"Error extracting text from PDF: {e}")
+        return None
+
+
+def _parse_if_final(text: str) -> Tuple[Optional[Dict], Optional["parsers.StatementFields"]]:
+    """
+    Detect and parse the first pages of a statement if later pages cannot
+    change the result
+    
+    The bank must be settled by the header alone (detect_bank checks it
+    before the rest of the text) and every field must be final.
+    
+    Args:
+        text: Text of the pages read so far
+        
+    Returns:
+        Tuple of (bank configuration, parser result), or (None, None) if
+        more pages are needed
+    """
+    if len(text) < DETECTION_HEADER_CHARS:
+        return None, None
+    
+    bank_config = _bank_for_issuer(parsers.detect_issuer(text[:DETECTION_HEADER_CHARS]))
+    if bank_config is None:
+        return None, None
+    
+    parsed_data = bank_config["parser"](text)
+    if not _is_final(parsed_data):
+        return None, None
+    return bank_config, parsed_data
+
+
+def _is_final(parsed_data) -> bool:
+    """
+    Check whether reading more pages could still change a parser result
+    
+    Every field must have been won by its first-priority pattern; a
+    lower-priority match could be displaced by a better one on a later
+    page. Parsers that do not report this are never treated as final.
+    """
+    return getattr(parsed_data, "final", False)
+
+
+def parse_statement(pdf_path: PDFSource, use_ocr: bool = False) -> Dict:
     """
     Main function to parse credit card statement
     
     Args:
-        pdf_path: Path to the PDF statement
+        pdf_path: Path to the PDF statement, or its raw bytes / a binary
+            stream (e.g. an upload held in memory)
         use_ocr: Whether to use OCR fallback
         
     Returns:
         Dictionary containing parsed data
     """
-    # Validate file exists
-    if not Path(pdf_path).exists():
-        return {
-            "error": "File not found",
-            "message": f"The file {pdf_path} does not exist"
-        }
-    
-    # Extract text from PDF
-    print(f"Extracting text from: {pdf_path}")
-    text = extract_text_from_pdf(pdf_path)
+    if _is_path(pdf_path):
+        # Validate file exists
+        if not Path(pdf_path).exists():
+            return {
+                "error": "File not found",
+                "message": f"The file {pdf_path} does not exist"
+            }
+        print(f"Extracting text from: {pdf_path}")
+    else:
+        print("Extracting text from in-memory PDF")
     
+    text = ""
+    bank_config = None
+    parsed_data = None
+    # Scanned statements have no text layer; when OCR is enabled skip the
+    # guaranteed-empty extraction and go straight to OCR
+    if use_ocr and not has_text_layer(pdf_path):
+        print("No text layer found (scanned PDF). Skipping text extraction.")
+    else:
+        page_texts = []
+        with closing(iter_page_text(pdf_path)) as pages:
+            # Try to stop after each of the first pages, then read the rest
+            # in one go and parse once
+            for limit in [1] * EARLY_EXIT_PAGES + [None]:
+                new_pages = _read_pages(pages, limit)
+                if new_pages is None:
+                    page_texts = []
+                    break
+                page_texts.extend(new_pages)
+                if limit is None or not new_pages:
+                    break
+                bank_config, parsed_data = _parse_if_final("\n".join(page_texts))
+                if parsed_data is not None:
+                    break
+        text = "\n".join(page_texts)
+        
     # Fallback to OCR if text extraction failed or returned minimal text
     if use_ocr and (not text or len(text.strip()) < 100):
         print("Text extraction yielded minimal results. Attempting OCR...")
         text = extract_text_with_ocr(pdf_path)
+        bank_config = None
+        parsed_data = None
     
     if not text or len(text.strip()) < 50:
         return {
@@ -155,7 +734,8 @@ def parse_statement(pdf_path: str, use_ocr: bool = False) -> Dict:
     
     # Detect bank
     print("Detecting bank issuer...")
-    bank_config = detect_bank(text)
+    if bank_config is None:
+        bank_config = detect_bank(text)
     
     if not bank_config:
         return {
@@ -167,9 +747,10 @@ def parse_statement(pdf_path: str, use_ocr: bool = False) -> Dict:
     
     # Parse statement using bank-specific parser
     print("Parsing statement...")
-    parsed_data = bank_config["parser"](text)
+    if parsed_data is None:
+        parsed_data = bank_config["parser"](text)
     
-    return parsed_data
+    return parsed_data.to_dict()
 
 
 def main():
@@ -1,22 +1,53 @@
 """
 Credit Card Statement Parsers Package
+
+Parser modules are imported lazily on first attribute access (PEP 562), so
+importing the package does not compile every bank's patterns up front.
 """
 
-from .hdfc_parser import parse_hdfc_statement, validate_hdfc_statement
-from .icici_parser import parse_icici_statement, validate_icici_statement
-from .sbi_parser import parse_sbi_statement, validate_sbi_statement
-from .axis_parser import parse_axis_statement, validate_axis_statement
-from .amex_parser import parse_amex_statement, validate_amex_statement
-
-__all__ = [
-    'parse_hdfc_statement',
-    'validate_hdfc_statement',
-    'parse_icici_statement',
-    'validate_icici_statement',
-    'parse_sbi_statement',
-    'validate_sbi_statement',
-    'parse_axis_statement',
-    'validate_axis_statement',
-    'parse_amex_statement',
-    'validate_amex_statement',
-]
+import importlib
+
+# Exported name -> submodule that defines it
+_EXPORTS = {
+    'parse_hdfc_statement': 'hdfc_parser',
+    'parse_hdfc_statements': 'hdfc_parser',
+    'validate_hdfc_statement': 'hdfc_parser',
+    'HDFC_KEYWORDS': 'hdfc_parser',
+    'parse_icici_statement': 'icici_parser',
+    'parse_icici_statements': 'icici_parser',
+    'validate_icici_statement': 'icici_parser',
+    'ICICI_KEYWORDS': 'icici_parser',
+    'parse_sbi_statement': 'sbi_parser',
+    'parse_sbi_statements': 'sbi_parser',
+    'validate_sbi_statement': 'sbi_parser',
+    'SBI_KEYWORDS': 'sbi_parser',
+    'parse_axis_statement': 'axis_parser',
+    'parse_axis_statements': 'axis_parser',
+    'validate_axis_statement': 'axis_parser',
+    'AXIS_KEYWORDS': 'axis_parser',
+    'parse_amex_statement': 'amex_parser',
+    'parse_amex_statements': 'amex_parser',
+    'validate_amex_statement': 'amex_parser',
+    'AMEX_KEYWORDS': 'amex_parser',
+    'StatementFields': '_common',
+    'RECORD_FIELDS': '_common',
+    'detect_issuer': '_issuer',
+    'ISSUER_FINGERPRINTS': '_issuer',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,565 @@
+"""
+Shared helpers for the bank statement parsers
+"""
+
+import re
+from bisect import bisect_right
+from dataclasses import dataclass, field as dataclass_field
+from functools import cached_property, lru_cache
+from itertools import accumulate
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Optional: google-re2 matches every pattern of every field in one DFA pass
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# From this text length on, the winning patterns are also run with RE2, so no
+# field can hit catastrophic backtracking on long or hostile text (below it,
+# the per-call overhead of RE2 outweighs re's backtracking)
+RE2_MIN_TEXT_LENGTH = 16384
+
+# From this text length on, scan() starts each capture search at the
+# pattern's anchor word; below it, lowercasing the text to find the anchors
+# costs more than the search skips
+ANCHOR_MIN_TEXT_LENGTH = 4096
+
+# Joins statements for batch scanning; no field pattern can match it, so no
+# match ever spans two statements
+DOCUMENT_SEPARATOR = "\x00"
+
+# An unescaped "$" anchors a pattern to the end of the text (or just before
+# a final newline); in a joined corpus the same spots are followed by the
+# separator or the end of the corpus
+_END_ANCHOR = re.compile(r"(?<!\\)\$")
+_BATCH_END = r"(?=\n?(?:\x00|\Z))"
+
+# RE2's \s and \d only match ASCII, while re matches their Unicode
+# counterparts (NBSP, thin spaces, Devanagari digits...); these spellings
+# match the same characters.
+_RE2_ESCAPES = {
+    "s": r"\s\x{0b}\x{1c}-\x{1f}\x{85}\p{Z}",
+    "d": r"\p{Nd}",
+}
+
+# RE2's case folding leaves out the Turkish dotted and dotless i, which re
+# matches against i and I under IGNORECASE
+_RE2_UNFOLDED = ("\u0130", "\u0131")
+
+# Validators lowercase the text in windows of this many characters, so a
+# keyword near the top never costs a lowercase copy of the whole statement
+KEYWORD_WINDOW_CHARS = 8192
+
+
+@lru_cache(maxsize=None)
+def _encode_keywords(keywords: Sequence[str]) -> Tuple[bytes, ...]:
+    """Return the keywords as UTF-8 bytes (cached per keyword tuple)"""
+    return tuple(keyword.encode("utf-8") for keyword in keywords)
+
+
+def contains_keyword(text: str, keywords: Sequence[str]) -> bool:
+    """
+    Check whether text contains any of the keywords, ignoring case
+    
+    Args:
+        text: Extracted text from PDF
+        keywords: Lowercase ASCII keywords (hashable, e.g. a tuple)
+        
+    Returns:
+        True if any keyword occurs in the text
+    """
+    encoded = _encode_keywords(keywords)
+    # Windows overlap by one keyword length so no occurrence is split
+    overlap = max(map(len, encoded)) - 1
+    step = KEYWORD_WINDOW_CHARS - overlap
+    for start in range(0, max(len(text), 1), step):
+        # bytes.lower() only folds ASCII, which is all the keywords need, and
+        # is far cheaper than str.lower() on text holding "₹" (two bytes per
+        # character as a str)
+        window = text[start:start + KEYWORD_WINDOW_CHARS].encode("utf-8", "surrogatepass").lower()
+        if any(keyword in window for keyword in encoded):
+            return True
+    return False
+
+
+def _leading_literal(pattern: str) -> str:
+    """
+    Return the literal word a pattern must start with, lowercased
+    
+    Args:
+        pattern: Regex source, e.g. r"Payment\s+Due\s+Date[:\s]+(...)"
+    
+    Returns:
+        The leading run of plain letters ("payment" above), or "" if the
+        pattern starts with a group, class or escape
+    """
+    match = re.match(r"[A-Za-z]+", pattern)
+    if not match:
+        return ""
+    literal = match.group()
+    # A trailing quantifier ("Ms?", "X+", "a{2}") applies to the last letter only
+    if pattern[match.end():match.end() + 1] in ("?", "*", "+", "{"):
+        literal = literal[:-1]
+    return literal.lower()
+
+
+def to_re2_pattern(pattern: str) -> str:
+    """
+    Rewrite a re pattern so RE2 matches the same text
+    
+    Spells out the Unicode meaning of \\s and \\d, and turns "$" (end of
+    text or before a final newline in Python) into its RE2 equivalent.
+    
+    Args:
+        pattern: Regex source using only RE2-compatible syntax otherwise
+    
+    Returns:
+        The pattern for re2.compile / re2.Set
+    """
+    out = []
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\" and i + 1 < len(pattern):
+            escape = pattern[i + 1]
+            if escape in _RE2_ESCAPES:
+                body = _RE2_ESCAPES[escape]
+                out.append(body if in_class else f"[{body}]")
+            else:
+                out.append(pattern[i:i + 2])
+            i += 2
+            continue
+        
+        if in_class:
+            if char == "]":
+                in_class = False
+        elif char == "[":
+            in_class = True
+            # A "]" right after "[" or "[^" is a literal, not the class end
+            literal_end = 2 if pattern[i + 1:i + 2] == "^" else 1
+            if pattern[i + literal_end:i + literal_end + 1] == "]":
+                out.append(pattern[i:i + literal_end + 1])
+                i += literal_end + 1
+                continue
+        elif char == "$":
+            char = r"(?:\n?\z)"
+        out.append(char)
+        i += 1
+    return "".join(out)
+
+
+def re2_folds_like_re(text: str) -> bool:
+    """
+    Check whether RE2 ignores case in text the same way re does
+    
+    Args:
+        text: Text about to be matched case-insensitively
+    
+    Returns:
+        False if text holds a character RE2 does not fold ("İ", "ı"), in
+        which case it should be matched with re instead
+    """
+    return not any(char in text for char in _RE2_UNFOLDED)
+
+
+class _AnchorOffsets(dict):
+    """First offset of each anchor word in a lowercased text, found on demand"""
+    
+    def __init__(self, text_lower: str):
+        super().__init__()
+        self._text_lower = text_lower
+    
+    def __missing__(self, anchor: str) -> int:
+        # Several patterns share an anchor ("card", "payment", "total"), so
+        # each word is looked up once per text instead of once per pattern
+        offset = self[anchor] = self._text_lower.find(anchor)
+        return offset
+
+
+class FieldScanner:
+    """
+    Find the winning pattern for every field of a statement
+    
+    Each field has an ordered list of patterns; the first pattern in the list
+    that matches anywhere in the text wins, exactly as if the patterns were
+    tried one by one with re.search. When google-re2 is installed, all
+    patterns of all fields are compiled into a single RE2 set so one DFA pass
+    over the text tells us which patterns match; only the winning pattern of
+    each field is then run again to pull out its capture groups (with RE2 as
+    well for long texts, so matching stays linear-time end to end).
+    """
+    
+    def __init__(self, field_patterns: Dict[str, Sequence[str]], flags: int = re.IGNORECASE):
+        """
+        Args:
+            field_patterns: Mapping of field name to patterns in priority order
+            flags: Regex flags applied to every pattern
+        """
+        self._field_patterns = field_patterns
+        self._flags = flags
+        # RE2 only sees "$" at the end of the whole corpus, so its set cannot
+        # rule these patterns out in a batch
+        self._end_anchored = {
+            (field, priority)
+            for field, patterns in field_patterns.items()
+            for priority, pattern in enumerate(patterns)
+            if _END_ANCHOR.search(pattern)
+        }
+        # Literal each pattern starts with, used to skip and window searches
+        self._anchors = {
+            field: [_leading_literal(pattern) if flags & re.IGNORECASE else "" for pattern in patterns]
+            for field, patterns in field_patterns.items()
+        }
+    
+    # Patterns are compiled on first use rather than at import, so importing
+    # a parser (e.g. only to run its validator) costs no regex compilation
+    
+    @cached_property
+    def _fields(self) -> Dict[str, List[Any]]:
+        """Compiled patterns per field, in priority order"""
+        return {
+            field: [re.compile(pattern, self._flags) for pattern in patterns]
+            for field, patterns in self._field_patterns.items()
+        }
+    
+    @cached_property
+    def _batch_fields(self) -> Dict[str, List[Any]]:
+        """Compiled patterns for scan_many, with "$" also matching before a separator"""
+        return {
+            field: [re.compile(_END_ANCHOR.sub(lambda _: _BATCH_END, pattern), self._flags) for pattern in patterns]
+            for field, patterns in self._field_patterns.items()
+        }
+    
+    @cached_property
+    def _set(self):
+        """RE2 set over all patterns (see _build_set), or None"""
+        return self._build_set(self._field_patterns, self._flags)
+    
+    def _build_set(self, field_patterns: Dict[str, Sequence[str]], flags: int):
+        """
+        Compile all patterns into one RE2 set
+        
+        Returns:
+            Tuple of (RE2 set, list of (field, priority) per set index,
+            mapping of field name to RE2-compiled patterns), or None if
+            google-re2 is missing or cannot handle a pattern
+        """
+        if re2 is None:
+            return None
+        
+        prefix = "(?i)" if flags & re.IGNORECASE else ""
+        pattern_set = re2.Set.SearchSet()
+        owners = []
+        compiled = {}
+        try:
+            for field, patterns in field_patterns.items():
+                compiled[field] = []
+                for priority, pattern in enumerate(patterns):
+                    pattern = prefix + to_re2_pattern(pattern)
+                    pattern_set.Add(pattern)
+                    owners.append((field, priority))
+                    compiled[field].append(re2.compile(pattern))
+            pattern_set.Compile()
+        except re2.error:
+            return None
+        
+        return pattern_set, owners, compiled
+    
+    def scan(self, text: str) -> Dict[str, Any]:
+        """
+        Scan text and return the winning match for each field
+        
+        Args:
+            text: Extracted text from PDF
+        
+        Returns:
+            Dictionary of field name to (priority, match): the index of the
+            winning pattern in the field's list and its match object, from
+            re or RE2 (fields without any match are omitted)
+        """
+        if self._set is None or not re2_folds_like_re(text):
+            return self._scan_sequential(text)
+        
+        pattern_set, owners, compiled = self._set
+        try:
+            hits = pattern_set.Match(text)
+        except UnicodeEncodeError:
+            # google-re2 encodes text as strict UTF-8, which rejects lone
+            # surrogates (pdfminer emits them for unmapped glyphs)
+            return self._scan_sequential(text)
+        
+        # Set.Match returns None rather than an empty list when nothing hits
+        winners = {}
+        for index in hits or ():
+            field, priority = owners[index]
+            if field not in winners or priority < winners[field]:
+                winners[field] = priority
+        
+        fields = compiled if len(text) >= RE2_MIN_TEXT_LENGTH else self._fields
+        # Mid-sized texts start each capture search at the winner's anchor
+        # word, as _scan_sequential does (RE2 gains nothing from a start
+        # offset, and short texts are cheaper to rescan than to lowercase)
+        offsets = None
+        if ANCHOR_MIN_TEXT_LENGTH <= len(text) < RE2_MIN_TEXT_LENGTH:
+            text_lower = text.lower()
+            if len(text_lower) == len(text):
+                offsets = _AnchorOffsets(text_lower)
+        
+        matches = {}
+        for field, first in winners.items():
+            patterns = fields[field]
+            anchors = self._anchors[field]
+            for priority in range(first, len(patterns)):
+                regex, anchor = patterns[priority], anchors[priority]
+                start = 0
+                if anchor and offsets is not None:
+                    start = offsets[anchor]
+                    if start < 0:
+                        continue
+                match = regex.search(text, start)
+                if match:
+                    matches[field] = (priority, match)
+                    break
+        
+        return matches
+    
+    def _scan_sequential(self, text: str) -> Dict[str, Any]:
+        """
+        Try each field's precompiled patterns in order
+        
+        Patterns that start with a literal word are only run if that word
+        occurs in the text (a C-level str.find), and then only from its first
+        occurrence onwards, since no match can start earlier.
+        
+        A per-field alternation (one named group per pattern) would need one
+        search only, but it returns the leftmost match rather than the first
+        pattern in priority order. Recovering priority takes extra searches
+        over the rest of the text, and a backtracking engine also loses the
+        literal-prefix scan it does for a single pattern. Measured with the
+        regex module, that was 2-4x slower than the loop below.
+        """
+        text_lower = text.lower()
+        # Lowercasing can change the length (e.g. "İ"); offsets are only
+        # reusable when it does not
+        same_offsets = len(text_lower) == len(text)
+        offsets = _AnchorOffsets(text_lower)
+        
+        matches = {}
+        for field, patterns in self._fields.items():
+            for priority, (regex, anchor) in enumerate(zip(patterns, self._anchors[field])):
+                start = 0
+                if anchor:
+                    start = offsets[anchor]
+                    if start < 0:
+                        continue
+                    if not same_offsets:
+                        start = 0
+                match = regex.search(text, start)
+                if match:
+                    matches[field] = (priority, match)
+                    break
+        
+        return matches
+    
+    def scan_many(self, texts: Sequence[str]) -> List[Dict[str, Any]]:
+        """
+        Scan several statements and return the winning matches for each
+        
+        The texts are joined into one corpus and every pattern runs over it
+        once with finditer, instead of once per statement; bisecting a
+        match's offset against the statement start offsets tells which
+        statement it belongs to.
+        
+        Args:
+            texts: Extracted texts, one per statement
+        
+        Returns:
+            One dictionary per text, as returned by scan()
+        """
+        if any(DOCUMENT_SEPARATOR in text for text in texts):
+            return [self.scan(text) for text in texts]
+        
+        corpus = DOCUMENT_SEPARATOR.join(texts)
+        # starts[i] is the offset of texts[i] in the corpus
+        starts = [0] + list(accumulate(len(text) + 1 for text in texts[:-1]))
+        corpus_lower = corpus.lower()
+        same_offsets = len(corpus_lower) == len(corpus)
+        offsets = _AnchorOffsets(corpus_lower)
+        
+        # One RE2 pass over the corpus rules out patterns that match nowhere
+        matching = None
+        if self._set is not None and re2_folds_like_re(corpus):
+            pattern_set, owners, _ = self._set
+            try:
+                matching = {owners[index] for index in pattern_set.Match(corpus) or ()}
+                matching |= self._end_anchored
+            except UnicodeEncodeError:
+                # A lone surrogate in some text (see scan); run every pattern
+                matching = None
+        
+        results = [{} for _ in texts]
+        for field, patterns in self._batch_fields.items():
+            pending = set(range(len(texts)))
+            for priority, (regex, anchor) in enumerate(zip(patterns, self._anchors[field])):
+                if not pending:
+                    break
+                if matching is not None and (field, priority) not in matching:
+                    continue
+                
+                start = 0
+                if anchor:
+                    start = offsets[anchor]
+                    if start < 0:
+                        continue
+                    if not same_offsets:
+                        start = 0
+                
+                for match in regex.finditer(corpus, start):
+                    index = bisect_right(starts, match.start()) - 1
+                    if index in pending:
+                        # finditer yields matches left to right, so this is
+                        # the pattern's first match within that statement
+                        results[index][field] = (priority, match)
+                        pending.discard(index)
+                        if not pending:
+                            break
+        
+        return results
+
+
+# Fields every parser returns after "issuer", in output order
+FIELDS = ("card_holder", "last_4_digits", "billing_cycle", "payment_due_date", "total_amount_due")
+
+# Column names matching StatementFields.to_tuple(), e.g. for
+# pd.DataFrame.from_records([r.to_tuple() for r in results], columns=RECORD_FIELDS)
+RECORD_FIELDS = ("issuer",) + FIELDS
+
+
+@dataclass(slots=True)
+class StatementFields:
+    """
+    Fields extracted from one statement (None for fields not found)
+    
+    A slotted record is cheaper to build than a six-key dict; callers that
+    need JSON or a mapping use to_dict().
+    """
+    issuer: str
+    card_holder: Optional[str] = None
+    last_4_digits: Optional[str] = None
+    billing_cycle: Optional[str] = None
+    payment_due_date: Optional[str] = None
+    total_amount_due: Optional[str] = None
+    # True when every field was won by its first-priority pattern, so no
+    # further text can replace a value (see main.parse_statement)
+    final: bool = dataclass_field(default=False, repr=False, compare=False)
+    
+    def to_dict(self) -> Dict[str, Optional[str]]:
+        """Return the fields as a dict, issuer first"""
+        return {
+            "issuer": self.issuer,
+            "card_holder": self.card_holder,
+            "last_4_digits": self.last_4_digits,
+            "billing_cycle": self.billing_cycle,
+            "payment_due_date": self.payment_due_date,
+            "total_amount_due": self.total_amount_due,
+        }
+    
+    def to_tuple(self) -> Tuple[Optional[str], ...]:
+        """Return the fields as a row in RECORD_FIELDS order (cheapest form for a DataFrame)"""
+        return (
+            self.issuer,
+            self.card_holder,
+            self.last_4_digits,
+            self.billing_cycle,
+            self.payment_due_date,
+            self.total_amount_due,
+        )
+
+
+def _pick_last_4_digits(match) -> str:
+    """Take the last group of a full card number, else the only group"""
+    if len(match.groups()) == 4:
+        return match.group(4)
+    return match.group(1)
+
+
+def _pick_billing_cycle(match) -> str:
+    """Join separate start/end date groups, else take the whole period"""
+    if len(match.groups()) == 2:
+        return f"{match.group(1)} - {match.group(2)}"
+    return match.group(1).strip()
+
+
+RUPEE = "₹"
+
+# Currency marker and the amount that follows it, shared by every bank's
+# AMOUNT_PATTERNS (the amount capture never includes whitespace)
+CURRENCY = r"(?:\$|Rs\.?|INR|₹)"
+AMOUNT_NUMBER = r"([\d,]+\.?\d*)"
+AMOUNT_VALUE = CURRENCY + r"?\s*" + AMOUNT_NUMBER
+
+
+def _pick_total_amount_due(match) -> str:
+    """Normalise the amount to a rupee value"""
+    # Every amount capture is AMOUNT_NUMBER, so there is no whitespace to strip
+    return RUPEE + match.group(1)
+
+
+# How each field's value is read from its winning match
+_PICKERS: Dict[str, Callable[[Any], str]] = {
+    "card_holder": lambda match: match.group(1).strip(),
+    "last_4_digits": _pick_last_4_digits,
+    "billing_cycle": _pick_billing_cycle,
+    "payment_due_date": lambda match: match.group(1).strip(),
+    "total_amount_due": _pick_total_amount_due,
+}
+
+
+def parse_fields(text: str, issuer: str, scanner: FieldScanner) -> StatementFields:
+    """
+    Extract every statement field using a bank's pattern table
+    
+    Args:
+        text: Extracted text from PDF
+        issuer: Issuer name reported in the result
+        scanner: The bank's FieldScanner
+    
+    Returns:
+        StatementFields with the parsed data
+    """
+    return _fields_from_matches(scanner.scan(text), issuer)
+
+
+def parse_many(texts: Sequence[str], issuer: str, scanner: FieldScanner) -> List[StatementFields]:
+    """
+    Extract every statement field from many statements of one bank at once
+    
+    Args:
+        texts: Extracted texts, one per statement
+        issuer: Issuer name reported in the results
+        scanner: The bank's FieldScanner
+    
+    Returns:
+        One StatementFields per text, same as parse_fields (to_tuple()
+        rows with RECORD_FIELDS columns load fastest into a DataFrame)
+    """
+    return [_fields_from_matches(matches, issuer) for matches in scanner.scan_many(texts)]
+
+
+def _fields_from_matches(matches: Dict[str, Any], issuer: str) -> StatementFields:
+    """Turn a scanner result into StatementFields"""
+    values = []
+    final = True
+    for field in FIELDS:
+        winner = matches.get(field)
+        if winner:
+            priority, match = winner
+            values.append(_PICKERS[field](match))
+            final = final and priority == 0
+        else:
+            values.append(None)
+            final = False
+    # Positional construction skips the keyword handling of __init__
+    return StatementFields(issuer, *values, final)
@@ -0,0 +1,91 @@
+"""
+Issuer detection for credit card statements
+"""
+
+import re
+from typing import Callable, Optional
+
+from ._common import re2_folds_like_re, to_re2_pattern
+
+# Optional: google-re2 checks every fingerprint in one DFA pass
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# Issuer tag -> masthead fingerprint, in priority order (when a statement
+# mentions several banks, the first one listed wins)
+ISSUER_FINGERPRINTS = {
+    "hdfc": r"hdfc\s+bank|hdfc\s+credit\s+card|www\.hdfcbank\.com",
+    "icici": r"icici\s+bank|icici\s+credit\s+card|www\.icicibank\.com",
+    "sbi": r"sbi\s+card|state\s+bank|www\.sbicard\.com",
+    "axis": r"axis\s+bank|axis\s+credit\s+card|www\.axisbank\.com",
+    "amex": r"american\s+express|amex|www\.americanexpress\.com",
+}
+
+
+def _build_detector() -> Callable[[str], Optional[str]]:
+    """
+    Build a single-pass scanner over all issuer fingerprints
+    
+    Uses an RE2 set (one DFA pass) when google-re2 is installed, otherwise
+    (or for text RE2 cannot encode or fold like re) a combined alternation
+    with one named group per issuer.
+    
+    Returns:
+        Function mapping text to the highest-priority issuer tag found, or None
+    """
+    tags = list(ISSUER_FINGERPRINTS)
+    priority = {tag: index for index, tag in enumerate(tags)}
+    combined = re.compile(
+        "|".join(f"(?P<{tag}>{fingerprint})" for tag, fingerprint in ISSUER_FINGERPRINTS.items()),
+        re.IGNORECASE
+    )
+    
+    def scan(text: str) -> Optional[str]:
+        best = None
+        for match in combined.finditer(text):
+            tag = match.lastgroup
+            if best is None or priority[tag] < priority[best]:
+                best = tag
+                if priority[best] == 0:
+                    break
+        return best
+    
+    if re2 is None:
+        return scan
+    
+    issuer_set = re2.Set.SearchSet()
+    for fingerprint in ISSUER_FINGERPRINTS.values():
+        issuer_set.Add(f"(?i){to_re2_pattern(fingerprint)}")
+    issuer_set.Compile()
+    
+    def match_set(text: str) -> Optional[str]:
+        if not re2_folds_like_re(text):
+            return scan(text)
+        try:
+            hits = issuer_set.Match(text)
+        except UnicodeEncodeError:
+            # google-re2 encodes text as strict UTF-8, which rejects lone
+            # surrogates (pdfminer emits them for unmapped glyphs)
+            return scan(text)
+        # Set.Match returns None rather than an empty list when nothing hits
+        return tags[min(hits)] if hits else None
+    
+    return match_set
+
+
+_ISSUER_DETECTOR = _build_detector()
+
+
+def detect_issuer(text: str) -> Optional[str]:
+    """
+    Identify the card issuer from its masthead fingerprint in one scan
+    
+    Args:
+        text: Extracted text from PDF
+    
+    Returns:
+        Issuer tag ("hdfc", "icici", "sbi", "axis" or "amex") or None
+    """
+    return _ISSUER_DETECTOR(text)
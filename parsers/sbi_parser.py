@@ -3,11 +3,98 @@ SBI Card Statement Parser
 Extracts key information from SBI credit card statements
 """
 
-import re
-from typing import Dict, Optional
+from typing import List, Sequence
 
+from ._common import (
+    AMOUNT_NUMBER, AMOUNT_VALUE, CURRENCY, FieldScanner, StatementFields,
+    contains_keyword, parse_fields, parse_many
+)
 
-def parse_sbi_statement(text: str) -> Dict[str, Optional[str]]:
+
+NAME_PATTERNS = [
+    r"Card\s+holder\s+Name\s*:\s*([A-Z][A-Za-z\s]+?)(?:\n|Name:|Address:|For|$)",
+    r"Card\s+(?:Holder|Member)[:\s]+([A-Z][A-Z\s]+?)(?:\n|Card|Number|\d)",
+    r"Card\s*Holder[:\s]+([A-Z][A-Z\s]+?)(?:\n|Card|Number|\d)",
+    r"Name\s+on\s+Card[:\s]+([A-Z][A-Z\s]+?)(?:\n|Card|Number|\d)",
+    r"Primary\s+(?:Card\s+)?Member[:\s]+([A-Z][A-Z\s]+?)(?:\n|Card|Number|\d)",
+    r"Customer\s+Name[:\s]+([A-Z][A-Z\s]+?)(?:\n|Card|Number|\d)",
+    r"Account\s+Holder[:\s]+([A-Z][A-Z\s]+?)(?:\n|Card|Number|\d)",
+    r"Name[:\s]+([A-Z][A-Z\s]+?)(?:\n|Card)",
+    r"Dear\s+([A-Z][A-Z\s]+?)(?:,|\n)",
+    r"Mr\.?\s+([A-Z][A-Z\s]+?)(?:\n|,)",
+    r"Ms\.?\s+([A-Z][A-Z\s]+?)(?:\n|,)",
+    r"Mrs\.?\s+([A-Z][A-Z\s]+?)(?:\n|,)"
+]
+
+CARD_PATTERNS = [
+    r"(\d{4})\s+(\d{4})\s+(\d{4})\s+(\d{4})",  # Full card number
+    r"Card\s+(?:Number|ending|No\.?|number)[:\s]+(?:X[X\s]*)?(\d{4})",
+    r"Card\s+No\.?\s*[:\s]*[X\*]+(\d{4})",
+    r"(?:X{4}\s+){3}(\d{4})",
+    r"(?:\*{4}\s+){3}(\d{4})",
+    r"ending\s+(?:with\s+|in\s+)?(\d{4})",
+    r"Card\s+ending\s+(?:with|in)?[:\s]+(\d{4})",
+    r"(?:XXXX|xxxx|\*{4})\s*(?:XXXX|xxxx|\*{4})\s*(?:XXXX|xxxx|\*{4})\s*(\d{4})",
+    r"[X\*]{12}(\d{4})",
+    r"Card:\s*[X\*]+(\d{4})",
+    r"(?:Card|CARD)\s+[X\*]{4,}\s*(\d{4})"
+]
+
+CYCLE_PATTERNS = [
+    r"Opening/Closing\s+Date\s+(\d{1,2}/\d{1,2}/[A-Z]{2})\s*[-–]\s*(\d{1,2}/\d{1,2}/[A-Z]{2})",
+    r"Statement\s+Period[:\s]+(\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4}\s*[-–to\s]+\s*\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4})",
+    r"Billing\s+(?:Cycle|Period)[:\s]+(\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4}\s*[-–to\s]+\s*\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4})",
+    r"Statement\s+Date[:\s]+(\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4}\s*[-–to\s]+\s*\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4})",
+    r"Period[:\s]+(\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4}\s*[-–to\s]+\s*\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4})",
+    r"(\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4}\s*[-–]+\s*\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4})",
+    r"From[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{4})\s+To[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{4})",
+    r"(\d{1,2}[/-]\d{1,2}[/-]\d{4})\s+(?:to|-)\s+(\d{1,2}[/-]\d{1,2}[/-]\d{4})"
+]
+
+DUE_DATE_PATTERNS = [
+    r"Payment\s+due\s+date\s*:\s*(\d{1,2}/\d{1,2}/\d{4})",
+    r"Payment\s+Due\s+Date[:\s]+(\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4})",
+    r"Due\s+Date[:\s]+(\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4})",
+    r"Pay\s+by[:\s]+(\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4})",
+    r"Payment\s+Due[:\s]+(\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4})",
+    r"Due\s+on[:\s]+(\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4})",
+    r"Payment\s+Due\s+Date[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{4})",
+    r"Due\s+Date[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{4})",
+    r"Pay\s+by[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{4})"
+]
+
+AMOUNT_PATTERNS = [
+    r"New\s+Balance\s+" + AMOUNT_VALUE,
+    r"Total\s+balance\s*:\s*" + AMOUNT_VALUE,
+    r"Total\s+Amount\s+Due[:\s]+" + AMOUNT_VALUE,
+    r"Total\s+Due[:\s]+" + AMOUNT_VALUE,
+    r"Amount\s+Due[:\s]+" + AMOUNT_VALUE,
+    r"Total\s+Outstanding[:\s]+" + AMOUNT_VALUE,
+    r"Outstanding\s+(?:Amount)?[:\s]+" + AMOUNT_VALUE,
+    r"Amount\s+Payable[:\s]+" + AMOUNT_VALUE,
+    r"Payable[:\s]+" + AMOUNT_VALUE,
+    CURRENCY + r"\s*" + AMOUNT_NUMBER + r"\s+Total\s+(?:Amount\s+)?Due",
+    CURRENCY + r"\s*" + AMOUNT_NUMBER + r"\s+(?:is\s+)?(?:the\s+)?Total"
+]
+
+# Issuer keywords, lowercased once at import for the validator
+SBI_KEYWORDS = (
+    "sbi card",
+    "state bank",
+    "www.sbicard.com",
+)
+
+# All field patterns are matched in a single pass over the text
+_SCANNER = FieldScanner({
+    "card_holder": NAME_PATTERNS,
+    "last_4_digits": CARD_PATTERNS,
+    "billing_cycle": CYCLE_PATTERNS,
+    "payment_due_date": DUE_DATE_PATTERNS,
+    "total_amount_due": AMOUNT_PATTERNS,
+})
+
+
+def parse_sbi_statement(text: str) -> StatementFields:
     """
     Parse SBI Card credit card statement
     
@@ -15,128 +102,22 @@ def parse_sbi_statement(text: str) -> Dict[str, Optional[str]]:
         text: Extracted text from PDF
         
     Returns:
-        Dictionary containing parsed data
+        StatementFields with the parsed data (to_dict() for JSON)
     """
-    data = {
-        "issuer": "SBI Card",
-        "card_holder": None,
-        "last_4_digits": None,
-        "billing_cycle": None,
-        "payment_due_date": None,
-        "total_amount_due": None
-    }
-    
-    # Extract Card Holder Name
-    name_patterns = [
-        r"Card\s+holder\s+Name\s*:\s*([A-Z][A-Za-z\s]+?)(?:\n|Name:|Address:|For|$)",
-        r"Card\s+(?:Holder|Member)[:\s]+([A-Z][A-Z\s]+?)(?:\n|Card|Number|\d)",
-        r"Card\s*Holder[:\s]+([A-Z][A-Z\s]+?)(?:\n|Card|Number|\d)",
-        r"Cardholder[:\s]+([A-Z][A-Z\s]+?)(?:\n|Card|Number|\d)",
-        r"Name\s+on\s+Card[:\s]+([A-Z][A-Z\s]+?)(?:\n|Card|Number|\d)",
-        r"Primary\s+(?:Card\s+)?Member[:\s]+([A-Z][A-Z\s]+?)(?:\n|Card|Number|\d)",
-        r"Customer\s+Name[:\s]+([A-Z][A-Z\s]+?)(?:\n|Card|Number|\d)",
-        r"Account\s+Holder[:\s]+([A-Z][A-Z\s]+?)(?:\n|Card|Number|\d)",
-        r"Name[:\s]+([A-Z][A-Z\s]+?)(?:\n|Card)",
-        r"Dear\s+([A-Z][A-Z\s]+?)(?:,|\n)",
-        r"Mr\.?\s+([A-Z][A-Z\s]+?)(?:\n|,)",
-        r"Ms\.?\s+([A-Z][A-Z\s]+?)(?:\n|,)",
-        r"Mrs\.?\s+([A-Z][A-Z\s]+?)(?:\n|,)"
-    ]
-    
-    for pattern in name_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            data["card_holder"] = match.group(1).strip()
-            break
-    
-    # Extract Last 4 Digits of Card Number
-    card_patterns = [
-        r"(\d{4})\s+(\d{4})\s+(\d{4})\s+(\d{4})",  # Full card number
-        r"Card\s+(?:Number|ending|No\.?|number)[:\s]+(?:X+\s*)*(\d{4})",
-        r"Card\s+No\.?\s*[:\s]*[X\*]+(\d{4})",
-        r"(?:X{4}\s+){3}(\d{4})",
-        r"(?:\*{4}\s+){3}(\d{4})",
-        r"ending\s+(?:with\s+|in\s+)?(\d{4})",
-        r"Card\s+ending\s+(?:with|in)?[:\s]+(\d{4})",
-        r"(?:XXXX|xxxx|\*{4})\s*(?:XXXX|xxxx|\*{4})\s*(?:XXXX|xxxx|\*{4})\s*(\d{4})",
-        r"[X\*]{12}(\d{4})",
-        r"Card:\s*[X\*]+(\d{4})",
-        r"(?:Card|CARD)\s+[X\*]{4,}\s*(\d{4})"
-    ]
-    
-    for pattern in card_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            # If pattern has 4 groups (full card number), take the last group
-            if len(match.groups()) == 4:
-                data["last_4_digits"] = match.group(4)
-            else:
-                data["last_4_digits"] = match.group(1)
-            break
-    
-    # Extract Billing Cycle / Statement Period
-    cycle_patterns = [
-        r"Opening/Closing\s+Date\s+(\d{1,2}/\d{1,2}/[A-Z]{2})\s*[-–]\s*(\d{1,2}/\d{1,2}/[A-Z]{2})",
-        r"Statement\s+Period[:\s]+(\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4}\s*[-–to\s]+\s*\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4})",
-        r"Billing\s+(?:Cycle|Period)[:\s]+(\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4}\s*[-–to\s]+\s*\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4})",
-        r"Statement\s+Date[:\s]+(\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4}\s*[-–to\s]+\s*\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4})",
-        r"Period[:\s]+(\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4}\s*[-–to\s]+\s*\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4})",
-        r"(\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4}\s*[-–]+\s*\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4})",
-        r"From[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{4})\s+To[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{4})",
-        r"(\d{1,2}[/-]\d{1,2}[/-]\d{4})\s+(?:to|-)\s+(\d{1,2}[/-]\d{1,2}[/-]\d{4})"
-    ]
-    
-    for pattern in cycle_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            if len(match.groups()) == 2:
-                data["billing_cycle"] = f"{match.group(1)} - {match.group(2)}"
-            else:
-                data["billing_cycle"] = match.group(1).strip()
-            break
-    
-    # Extract Payment Due Date
-    due_date_patterns = [
-        r"Payment\s+due\s+date\s*:\s*(\d{1,2}/\d{1,2}/\d{4})",
-        r"Payment\s+Due\s+Date[:\s]+(\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4})",
-        r"Due\s+Date[:\s]+(\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4})",
-        r"Pay\s+by[:\s]+(\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4})",
-        r"Payment\s+Due[:\s]+(\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4})",
-        r"Due\s+on[:\s]+(\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4})",
-        r"Payment\s+Due\s+Date[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{4})",
-        r"Due\s+Date[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{4})",
-        r"Pay\s+by[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{4})"
-    ]
-    
-    for pattern in due_date_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            data["payment_due_date"] = match.group(1).strip()
-            break
-    
-    # Extract Total Amount Due
-    amount_patterns = [
-        r"New\s+Balance\s+(?:\$|Rs\.?|INR|₹)?\s*([\d,]+\.?\d*)",
-        r"Total\s+balance\s*:\s*(?:\$|Rs\.?|INR|₹)?\s*([\d,]+\.?\d*)",
-        r"Total\s+Amount\s+Due[:\s]+(?:\$|Rs\.?|INR|₹)?\s*([\d,]+\.?\d*)",
-        r"Total\s+Due[:\s]+(?:\$|Rs\.?|INR|₹)?\s*([\d,]+\.?\d*)",
-        r"Amount\s+Due[:\s]+(?:\$|Rs\.?|INR|₹)?\s*([\d,]+\.?\d*)",
-        r"Total\s+Outstanding[:\s]+(?:\$|Rs\.?|INR|₹)?\s*([\d,]+\.?\d*)",
-        r"Outstanding\s+(?:Amount)?[:\s]+(?:\$|Rs\.?|INR|₹)?\s*([\d,]+\.?\d*)",
-        r"Amount\s+Payable[:\s]+(?:\$|Rs\.?|INR|₹)?\s*([\d,]+\.?\d*)",
-        r"Payable[:\s]+(?:\$|Rs\.?|INR|₹)?\s*([\d,]+\.?\d*)",
-        r"(?:\$|Rs\.?|INR|₹)\s*([\d,]+\.?\d*)\s+Total\s+(?:Amount\s+)?Due",
-        r"(?:\$|Rs\.?|INR|₹)\s*([\d,]+\.?\d*)\s+(?:is\s+)?(?:the\s+)?Total"
-    ]
-    
-    for pattern in amount_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            amount = match.group(1).strip()
-            data["total_amount_due"] = f"₹{amount}"
-            break
+    return parse_fields(text, "SBI Card", _SCANNER)
+
+
+def parse_sbi_statements(texts: Sequence[str]) -> List[StatementFields]:
+    """
+    Parse many SBI Card statements in one batch
     
-    return data
+    Args:
+        texts: Extracted text of each statement
+        
+    Returns:
+        One StatementFields per statement
+    """
+    return parse_many(texts, "SBI Card", _SCANNER)
 
 
 def validate_sbi_statement(text: str) -> bool:
@@ -149,13 +130,4 @@ def validate_sbi_statement(text: str) -> bool:
     Returns:
         True if SBI statement, False otherwise
     """
-    sbi_keywords = [
-        "SBI Card",
-        "SBI CARD",
-        "sbi card",
-        "State Bank",
-        "www.sbicard.com"
-    ]
-    
-    text_lower = text.lower()
-    return any(keyword.lower() in text_lower for keyword in sbi_keywords)
+    return contains_keyword(text, SBI_KEYWORDS)
@@ -1,52 +1,83 @@
 """
 Quick test script - Run this with your PDF to see what's happening
 Usage: python quick_test.py path/to/your/statement.pdf
+       python quick_test.py path/to/folder/of/statements
 """
 
 import sys
 import json
-from main import parse_statement
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 
-if len(sys.argv) < 2:
-    print("Usage: python quick_test.py <path_to_pdf>")
-    print("\nExample: python quick_test.py hdfc_statement.pdf")
-    sys.exit(1)
 
-pdf_path = sys.argv[1]
-
-print("\n" + "="*70)
-print("QUICK TEST - Credit Card Statement Parser")
-print("="*70)
-
-# Parse the statement
-result = parse_statement(pdf_path)
-
-# Display results
-print("\nRESULT:")
-print(json.dumps(result, indent=2, ensure_ascii=False))
-
-# Check what's missing
-if "error" not in result:
-    missing = [k for k, v in result.items() if v is None and k != "issuer"]
+def report(pdf_path, result):
+    """Print a parse result and explain any missing fields"""
+    print("\nRESULT:")
+    print(json.dumps(result, indent=2, ensure_ascii=False))
     
-    if missing:
-        print("\n" + "="*70)
-        print("⚠️  WARNING: Some fields are missing!")
-        print("="*70)
-        print(f"\nMissing fields: {', '.join(missing)}")
-        print("\nTo debug this issue, run:")
-        print(f"  python debug_parser.py {pdf_path}")
-        print("\nThis will show you:")
-        print("  - The extracted text from your PDF")
-        print("  - Which regex patterns matched and which failed")
-        print("  - Suggestions for fixing the patterns")
+    # Check what's missing
+    if "error" not in result:
+        missing = [k for k, v in result.items() if v is None and k != "issuer"]
+        
+        if missing:
+            print("\n" + "="*70)
+            print("⚠️  WARNING: Some fields are missing!")
+            print("="*70)
+            print(f"\nMissing fields: {', '.join(missing)}")
+            print("\nTo debug this issue, run:")
+            print(f"  python debug_parser.py {pdf_path}")
+            print("\nThis will show you:")
+            print("  - The extracted text from your PDF")
+            print("  - Which regex patterns matched and which failed")
+            print("  - Suggestions for fixing the patterns")
+        else:
+            print("\n" + "="*70)
+            print("✅ SUCCESS! All fields extracted successfully!")
+            print("="*70)
     else:
         print("\n" + "="*70)
-        print("✅ SUCCESS! All fields extracted successfully!")
+        print("❌ ERROR occurred during parsing")
         print("="*70)
-else:
+
+
+def main():
+    """CLI entry point"""
+    if len(sys.argv) < 2:
+        print("Usage: python quick_test.py <path_to_pdf_or_folder>")
+        print("\nExample: python quick_test.py hdfc_statement.pdf")
+        print("         python quick_test.py sample_pdfs/")
+        sys.exit(1)
+    
+    # Imported after the usage check so a bare invocation returns immediately
+    from main import parse_statement
+    
+    target = Path(sys.argv[1])
+    
     print("\n" + "="*70)
-    print("❌ ERROR occurred during parsing")
+    print("QUICK TEST - Credit Card Statement Parser")
     print("="*70)
+    
+    if target.is_dir():
+        # Each statement is parsed independently and CPU-bound, so spread
+        # the folder across one process per core
+        pdf_paths = sorted(str(path) for path in target.glob("*.pdf"))
+        if not pdf_paths:
+            print(f"\nNo PDF files found in {target}")
+            sys.exit(1)
+        
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(parse_statement, pdf_paths))
+        
+        for pdf_path, result in zip(pdf_paths, results):
+            print("\n" + "-"*70)
+            print(pdf_path)
+            report(pdf_path, result)
+    else:
+        # Parse the statement
+        report(str(target), parse_statement(str(target)))
+    
+    print()
+
 
-print()
+if __name__ == "__main__":
+    main()
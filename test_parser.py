@@ -4,11 +4,12 @@ Useful for debugging and testing individual parsers
 """
 
 from parsers import (
-    parse_hdfc_statement, validate_hdfc_statement,
-    parse_icici_statement, validate_icici_statement,
-    parse_sbi_statement, validate_sbi_statement,
-    parse_axis_statement, validate_axis_statement,
-    parse_amex_statement, validate_amex_statement
+    detect_issuer,
+    parse_hdfc_statement, parse_hdfc_statements, validate_hdfc_statement,
+    parse_icici_statement, parse_icici_statements, validate_icici_statement,
+    parse_sbi_statement, parse_sbi_statements, validate_sbi_statement,
+    parse_axis_statement, parse_axis_statements, validate_axis_statement,
+    parse_amex_statement, parse_amex_statements, validate_amex_statement
 )
 
 
@@ -60,6 +61,95 @@ SAMPLE_TEXTS = {
     """
 }
 
+# pdfminer maps unmapped glyphs to lone surrogates, which google-re2 cannot
+# encode; parsing and issuer detection must still work on such text
+SURROGATE_TEXT = "HDFC Bank \ud800 Name on Card: JOHN\n"
+
+# Labels separated by non-breaking spaces (common in PDF text layers); the
+# first pattern must still win, with or without google-re2 installed
+UNICODE_SPACE_CASES = [
+    ("HDFC Bank\nTotal\xa0Amount\xa0Due: Rs. 1,000.00\nPayable: 5\n", "total_amount_due", "₹1,000.00"),
+    ("Name\xa0on\xa0Card: JOHN DOE\nDear SIR,\n", "card_holder", "JOHN DOE"),
+    ("Payment\xa0Due\xa0Date: 15 Oct 2025\nDue on: 20 Oct 2025", "payment_due_date", "15 Oct 2025"),
+    (SURROGATE_TEXT, "card_holder", "JOHN"),
+    # RE2 does not fold "İ" to i/I as re does under IGNORECASE
+    ("Name on Card: İVAN PETROV\n", "card_holder", "İVAN PETROV"),
+]
+
+# Extra texts for the batch checks: a name that ends the text (a "$"-anchored
+# pattern, which must also stop at the batch separator), an empty text, a
+# text holding a lone surrogate and one RE2 cannot match case-insensitively
+BATCH_EDGE_TEXTS = [
+    "Card holder Name : JOHN DOE",
+    "",
+    "Card holder Name : JANE ROE\n",
+    SURROGATE_TEXT,
+    "Card holder Name : İVAN PETROV\n",
+]
+
+# A text containing the separator scan_many joins statements with, which
+# makes it fall back to parsing each text on its own
+SEPARATOR_TEXT = "HDFC Bank\x00Name on Card: JOHN DOE\nTotal Amount Due: Rs. 100.00\n"
+
+# Text -> issuer tag expected from detect_issuer
+ISSUER_CASES = [
+    (SAMPLE_TEXTS["hdfc"], "hdfc"),
+    (SAMPLE_TEXTS["icici"], "icici"),
+    (SAMPLE_TEXTS["sbi"], "sbi"),
+    (SAMPLE_TEXTS["axis"], "axis"),
+    (SAMPLE_TEXTS["amex"], "amex"),
+    ("HDFC\xa0Bank statement", "hdfc"),
+    (SURROGATE_TEXT, "hdfc"),
+    ("AXİS BANK statement", "axis"),
+    # Several banks mentioned: the earlier one in priority order wins
+    ("Pay your American Express card from your HDFC Bank account", "hdfc"),
+    ("", None),
+    ("No issuer here", None),
+]
+
+# Transaction filler that matches no field pattern; one copy fills more
+# than the header main.detect_bank checks first
+PAGE_FILLER = "Reward points earned on purchases this month\n" * 100
+
+# (description, page texts, fields parse_statement must return)
+MULTI_PAGE_CASES = [
+    # The first-priority amount only appears on page 4, after a
+    # lower-priority one on page 1
+    ("ICICI, best amount on page 4", [
+        "ICICI Bank Credit Card Statement\n"
+        "Card holder Name : AYUSH KARANI\n"
+        "1234 5678 9012 3456\n"
+        "Opening/Closing Date 09/01/AB - 10/01/AB\n"
+        "Payment due date : 10/20/2025\n"
+        "Amount Due: Rs. 500.00\n" + PAGE_FILLER,
+        PAGE_FILLER,
+        PAGE_FILLER,
+        "New Balance Rs. 25,500.00\n" + PAGE_FILLER,
+        PAGE_FILLER,
+    ], {"issuer": "ICICI Bank", "total_amount_due": "₹25,500.00"}),
+    # A first page shorter than the header does not settle the bank, even
+    # with every field final; HDFC on page 2 wins over Amex
+    ("Amex page 1, HDFC page 2", [
+        "American Express\n"
+        "Card holder Name : JOHN DOE\n"
+        "1111 2222 3333 4444\n"
+        "Opening/Closing Date 09/01/AB - 10/01/AB\n"
+        "Payment due date : 10/20/2025\n"
+        "New Balance $2,345.67\n",
+        "HDFC Bank\nName on Card: JOHN DOE\nTotal Amount Due: Rs. 100.00\n",
+    ], {"issuer": "HDFC Bank"}),
+    # Every field final on page 1: later pages must not change the result
+    ("Amex, all fields on page 1", [
+        "American Express\n"
+        "Card holder Name : JANE SMITH\n"
+        "1111 2222 3333 4444\n"
+        "Opening/Closing Date 09/01/AB - 10/01/AB\n"
+        "Payment due date : 10/20/2025\n"
+        "New Balance $2,345.67\n" + PAGE_FILLER,
+        "HDFC Bank\nNew Balance $9.99\n",
+    ], {"issuer": "American Express", "total_amount_due": "₹2,345.67"}),
+]
+
 
 def test_parser(bank_name: str, validator_func, parser_func):
     """Test a specific bank parser"""
@@ -81,7 +171,7 @@ def test_parser(bank_name: str, validator_func, parser_func):
         print(f"⚠️  Warning: Validator did not recognize {bank_name} text")
     
     # Test parsing
-    result = parser_func(text)
+    result = parser_func(text).to_dict()
     
     print("\nParsed Data:")
     print("-" * 60)
@@ -119,5 +209,97 @@ def test_all_parsers():
     print("="*60)
 
 
+def test_unicode_whitespace():
+    """Check that labels spaced with NBSP match the same patterns as plain spaces"""
+    print("\n" + "="*60)
+    print("Testing Unicode whitespace in labels")
+    print("="*60)
+    
+    for text, field, expected in UNICODE_SPACE_CASES:
+        value = parse_hdfc_statement(text).to_dict()[field]
+        status = "✓" if value == expected else "✗"
+        print(f"{status} {field:20s}: {value} (expected {expected})")
+        assert value == expected, f"{field}: got {value!r}, expected {expected!r}"
+
+
+def test_batch_parsing():
+    """Check each bank's batch parser against one single-text call per text"""
+    print("\n" + "="*60)
+    print("Testing batch parsing")
+    print("="*60)
+    
+    parsers = [
+        ("hdfc", parse_hdfc_statement, parse_hdfc_statements),
+        ("icici", parse_icici_statement, parse_icici_statements),
+        ("sbi", parse_sbi_statement, parse_sbi_statements),
+        ("axis", parse_axis_statement, parse_axis_statements),
+        ("amex", parse_amex_statement, parse_amex_statements),
+    ]
+    
+    batches = [
+        ("joined", list(SAMPLE_TEXTS.values()) + BATCH_EDGE_TEXTS),
+        ("with separator", [SAMPLE_TEXTS["hdfc"], SEPARATOR_TEXT] + BATCH_EDGE_TEXTS),
+    ]
+    
+    for bank_name, parse_one, parse_batch in parsers:
+        for batch_name, texts in batches:
+            expected = [parse_one(text) for text in texts]
+            results = parse_batch(texts)
+            same = (
+                [result.to_dict() for result in results] == [result.to_dict() for result in expected]
+                and [result.final for result in results] == [result.final for result in expected]
+            )
+            status = "✓" if same else "✗"
+            print(f"{status} {bank_name:6s} {batch_name}: {len(texts)} texts")
+            assert same, f"{bank_name} batch ({batch_name}) differs from single-text parsing"
+
+
+def test_detect_issuer():
+    """Check issuer detection on the samples and edge cases"""
+    print("\n" + "="*60)
+    print("Testing issuer detection")
+    print("="*60)
+    
+    for text, expected in ISSUER_CASES:
+        issuer = detect_issuer(text)
+        status = "✓" if issuer == expected else "✗"
+        print(f"{status} {text.strip()[:40]!r:44s}: {issuer} (expected {expected})")
+        assert issuer == expected, f"{text!r}: got {issuer!r}, expected {expected!r}"
+
+
+def test_multi_page_statements():
+    """Check that parse_statement reads as far into a statement as it must"""
+    import io
+    from contextlib import redirect_stdout
+    
+    import main
+    
+    print("\n" + "="*60)
+    print("Testing multi-page statements")
+    print("="*60)
+    
+    iter_page_text = main.iter_page_text
+    try:
+        for description, pages, expected in MULTI_PAGE_CASES:
+            # Serve the pages as if extracted from a PDF
+            main.iter_page_text = lambda pdf_path, backend=None, pages=pages: (page for page in pages)
+            with redirect_stdout(io.StringIO()):
+                result = main.parse_statement(b"")
+            
+            # Must match parsing the whole document at once
+            text = "\n".join(pages)
+            full = main.detect_bank(text)["parser"](text).to_dict()
+            same = result == full and all(result[key] == value for key, value in expected.items())
+            status = "✓" if same else "✗"
+            print(f"{status} {description}: {result.get('issuer')}, {result.get('total_amount_due')}")
+            assert same, f"{description}: got {result!r}, expected {full!r}"
+    finally:
+        main.iter_page_text = iter_page_text
+
+
 if __name__ == "__main__":
     test_all_parsers()
+    test_unicode_whitespace()
+    test_batch_parsing()
+    test_detect_issuer()
+    test_multi_page_statements()